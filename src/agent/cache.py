@@ -0,0 +1,58 @@
+"""On-disk TTL cache for scrape_matches results.
+
+Lets repeated identical scrape_matches calls within one agent session (the
+LLM re-asking after an error, or a quick re-run in dev) skip the browser.
+Entries are JSON files named by a SHA-256 of the scrape parameters; an
+entry is stale once its file is older than the configured TTL.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+import structlog
+
+logger = structlog.get_logger()
+
+
+def cache_key(**params: Any) -> str:
+    """Return a stable hex digest for a set of scrape parameters."""
+    blob = orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(blob).hexdigest()
+
+
+def load(cache_dir: Path, key: str, ttl: int) -> dict[str, Any] | None:
+    """Return the cached payload for key, or None if missing or older than ttl seconds."""
+    path = cache_dir / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def store(cache_dir: Path, key: str, payload: dict[str, Any]) -> None:
+    """Write payload for key, replacing any previous entry atomically.
+
+    Best-effort, like load: a cache that can't be written is logged and skipped.
+    """
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Unique temp name per writer, so concurrent stores can't clobber each other
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(orjson.dumps(payload))
+            os.replace(tmp, cache_dir / f"{key}.json")
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+    except OSError as exc:
+        logger.warning("scrape_cache.store_failed", key=key, error=str(exc))
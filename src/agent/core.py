@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_ai import Agent
@@ -16,8 +17,9 @@ from config.settings import AgentSettings
 AGENT_MD = Path(__file__).resolve().parents[2] / "agent.md"
 
 
+@lru_cache(maxsize=1)
 def _load_system_prompt() -> str:
-    """Load the system prompt from agent.md at the repo root."""
+    """Load the system prompt from agent.md at the repo root (read once per process)."""
     if AGENT_MD.is_file():
         return AGENT_MD.read_text().strip()
     msg = f"agent.md not found at {AGENT_MD}"
@@ -52,5 +54,5 @@ def create_agent(settings: AgentSettings) -> Agent[AgentDeps, AgentResult]:
         system_prompt=_load_system_prompt(),
         tools=[get_today_info, scrape_matches, submit_matches],
         retries=1,
-        max_concurrency=1,  # One Chromium at a time — fits pod resources, polite to MLS
+        max_concurrency=1,  # One run at a time; Chromium fan-out is AGENT_SCRAPE_CONCURRENCY
     )
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.celery.queue_client import MatchQueueClient
 
+    from agent.result import MatchRow
     from config.settings import AgentSettings
 
 
@@ -24,4 +25,4 @@ class AgentDeps:
     dry_run: bool = False
     headless: bool = True
     team_filter: str = ""
-    _scraped_matches: list[dict[str, Any]] = field(default_factory=list)
+    _scraped_matches: list[MatchRow] = field(default_factory=list)
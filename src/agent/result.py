@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -22,3 +23,32 @@ class AgentResult(BaseModel):
     actions: list[AgentAction] = []
     matches_found: int = 0
     matches_submitted: int = 0
+
+
+@dataclass(slots=True)
+class MatchRow:
+    """A scraped match normalized for missing-table, pending submission.
+
+    Kept as a slotted dataclass while it sits in the scrape accumulator;
+    converted to the MatchQueueClient dict payload only at publish time.
+    """
+
+    home_team: str
+    away_team: str
+    match_date: str
+    match_time: str | None
+    season: str
+    age_group: str
+    division: str
+    league: str
+    home_score: int | None
+    away_score: int | None
+    match_status: str
+    external_match_id: str | int | None  # Match.match_id — MLS Next IDs may be numeric or missing
+    location: str | None
+    match_type: str = "League"
+    source: str = "match-scraper-agent"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the queue payload for this match."""
+        return asdict(self)
@@ -3,17 +3,29 @@
 from __future__ import annotations
 
 import asyncio
+import io
 from datetime import UTC, date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from pydantic_ai import RunContext
+from src.scraper.config import ScrapingConfig
+from src.scraper.mls_scraper import MLSScraper
 
+from agent import cache as scrape_cache
 from agent.deps import AgentDeps
+from agent.result import MatchRow
+
+if TYPE_CHECKING:
+    from src.celery.queue_client import MatchQueueClient
+    from src.scraper.models import Match
 
 logger = structlog.get_logger()
 
-# Serialize browser launches — one Chromium at a time
-_scrape_semaphore = asyncio.Semaphore(1)
+# Bounds concurrent Chromium instances — sized from settings on first scrape
+_scrape_semaphore: asyncio.Semaphore | None = None
 
 # MLS Next full names → missing-table DB names
 TEAM_NAME_MAP: dict[str, str] = {
@@ -25,12 +37,38 @@ ACADEMY_TEAM_NAME_MAP: dict[str, str] = {
     "Intercontinental Football Academy of New England": "IFA Academy",
 }
 
+# Per-league lookup maps, finalized at import — Academy falls back to TEAM_NAME_MAP
+_HOMEGROWN_MAP: dict[str, str] = TEAM_NAME_MAP
+_ACADEMY_MAP: dict[str, str] = TEAM_NAME_MAP | ACADEMY_TEAM_NAME_MAP
+
+# (date, season) from the last _current_season call
+_season_cache: tuple[date | None, str] = (None, "")
+
+# Matches listed in the scrape summary sent back to the LLM — the middle of a
+# large result is elided so prompt tokens stay bounded
+_SUMMARY_HEAD = 30
+_SUMMARY_TAIL = 10
+
+# (UTC minute, response) from the last get_today_info call
+_today_cache: tuple[str, str] = ("", "")
+
+
+def _get_scrape_semaphore(limit: int) -> asyncio.Semaphore:
+    """Return the process-wide scrape semaphore, creating it on first use."""
+    global _scrape_semaphore
+    if _scrape_semaphore is None:
+        _scrape_semaphore = asyncio.Semaphore(max(limit, 1))
+    return _scrape_semaphore
+
+
+def _team_name_map(league: str) -> dict[str, str]:
+    """Return the display-name → missing-table-name map for a league."""
+    return _ACADEMY_MAP if league == "Academy" else _HOMEGROWN_MAP
+
 
-def _normalize_team_name(name: str, *, league: str = "") -> str:
-    """Map MLS Next display names to missing-table canonical names."""
-    if league == "Academy":
-        return ACADEMY_TEAM_NAME_MAP.get(name, TEAM_NAME_MAP.get(name, name))
-    return TEAM_NAME_MAP.get(name, name)
+def _normalize_team_name(name: str, *, mapping: dict[str, str]) -> str:
+    """Map an MLS Next display name to its missing-table canonical name."""
+    return mapping.get(name, name)
 
 
 def get_today_info(ctx: RunContext[AgentDeps]) -> str:
@@ -39,14 +77,25 @@ def get_today_info(ctx: RunContext[AgentDeps]) -> str:
     Returns the current date, day of week, and week number. Use this at the
     start of your run to understand what day it is.
     """
+    global _today_cache
     now = datetime.now(tz=UTC)
-    logger.info("tool.get_today_info", date=now.strftime("%Y-%m-%d"), day=now.strftime("%A"))
-    return (
-        f"Date: {now.strftime('%Y-%m-%d')}\n"
-        f"Day: {now.strftime('%A')}\n"
-        f"Week: {now.isocalendar().week}\n"
-        f"Time (UTC): {now.strftime('%H:%M')}"
-    )
+    key = f"{now:%Y-%m-%dT%H:%M}"
+    if _today_cache[0] != key:
+        _today_cache = (
+            key,
+            f"Date: {now:%Y-%m-%d}\n"
+            f"Day: {now:%A}\n"
+            f"Week: {now.isocalendar().week}\n"
+            f"Time (UTC): {now:%H:%M}",
+        )
+    logger.info("tool.get_today_info", date=key[:10], day=f"{now:%A}")
+    return _today_cache[1]
+
+
+@lru_cache(maxsize=64)
+def _parse_iso(value: str) -> date:
+    """Parse an ISO 8601 date — memoized since the LLM repeats the same ranges."""
+    return date.fromisoformat(value)
 
 
 # Season end date — enforced as a floor for end_date so the LLM can't
@@ -79,12 +128,9 @@ async def scrape_matches(
         club: Club name filter (e.g. "Intercontinental Football Academy of New England").
             Filters results to only matches involving this club. Optional.
     """
-    from src.scraper.config import ScrapingConfig
-    from src.scraper.mls_scraper import MLSScraper
-
     settings = ctx.deps.settings
-    parsed_start = date.fromisoformat(start_date)
-    parsed_end = date.fromisoformat(end_date)
+    parsed_start = _parse_iso(start_date)
+    parsed_end = _parse_iso(end_date)
 
     # Guarantee the end date covers the full season regardless of what the LLM passes
     if parsed_end < SEASON_END:
@@ -110,8 +156,8 @@ async def scrape_matches(
         missing_table_api_key=settings.missing_table_api_key or "unused",
     )
 
-    logger.info(
-        "tool.scrape_matches",
+    # Bind the scrape context once; every log line below carries it
+    log = logger.bind(
         start=start_date,
         end=end_date,
         age_group=config.age_group,
@@ -119,72 +165,62 @@ async def scrape_matches(
         division=config.division,
         conference=config.conference or None,
     )
+    log.info("tool.scrape_matches")
+
+    team_filter = ctx.deps.team_filter
+    key = ""
+    if settings.scrape_cache_enabled:
+        key = scrape_cache.cache_key(
+            start=parsed_start,
+            end=parsed_end,
+            age_group=config.age_group,
+            league=config.league,
+            division=config.division,
+            conference=config.conference,
+            club=config.club,
+            team_filter=team_filter,
+        )
+        cached = scrape_cache.load(Path(settings.scrape_cache_dir), key, settings.scrape_cache_ttl)
+        if cached is not None:
+            log.info("tool.scrape_matches.cache_hit", rows=len(cached["rows"]))
+            ctx.deps._scraped_matches += [MatchRow(**row) for row in cached["rows"]]
+            return cached["summary"]
 
-    async with _scrape_semaphore:
+    async with _get_scrape_semaphore(settings.scrape_concurrency):
         scraper = MLSScraper(config, headless=ctx.deps.headless)
         matches = await scraper.scrape_matches()
 
-    # For MT backend: division field stores the conference name for Academy league
-    # (MT has no separate conference field — "New England" is a division in Academy)
-    mt_division = config.conference if config.conference else config.division
-
-    # Accumulate matches for submit_matches to pick up
-    built = [
-        {
-            "home_team": _normalize_team_name(m.home_team, league=config.league),
-            "away_team": _normalize_team_name(m.away_team, league=config.league),
-            "match_date": m.match_datetime.date().isoformat(),
-            "match_time": m.match_datetime.strftime("%H:%M")
-            if m.match_datetime.hour or m.match_datetime.minute
-            else None,
-            "season": _current_season(),
-            "age_group": config.age_group,
-            "match_type": "League",
-            "division": mt_division,
-            "league": config.league,
-            "home_score": m.home_score if isinstance(m.home_score, int) else None,
-            "away_score": m.away_score if isinstance(m.away_score, int) else None,
-            "match_status": m.match_status,
-            "external_match_id": m.match_id,
-            "location": m.location,
-            "source": "match-scraper-agent",
-        }
-        for m in matches
-    ]
-
-    # Apply team filter if set (e.g. --target u14-hg-ifa)
-    team_filter = ctx.deps.team_filter
+    # Build rows for submit_matches to pick up, applying the team
+    # filter if set (e.g. --target u14-hg-ifa)
+    built = _build_match_rows(matches, config, team_filter=team_filter)
     if team_filter:
-        before = len(built)
-        built = [m for m in built if team_filter in (m["home_team"], m["away_team"])]
-        logger.info(
+        log.debug(
             "tool.scrape_matches.team_filter",
             team=team_filter,
-            before=before,
+            before=len(matches),
             after=len(built),
         )
 
-    ctx.deps._scraped_matches += built
-
     if not matches:
         target = f"{config.age_group} {config.league}"
         if config.conference:
             target += f" {config.conference}"
         elif config.division:
             target += f" {config.division}"
-        return f"No matches found for {target} ({start_date} to {end_date})."
-
-    # Build a human-readable summary for the LLM
-    lines = [f"Found {len(matches)} matches ({start_date} to {end_date}):"]
-    for m in matches:
-        score = f" ({m.home_score}-{m.away_score})" if m.has_score() else ""
-        status = m.match_status
-        lines.append(
-            f"  {m.match_datetime.date()} | {m.home_team} vs {m.away_team}{score} [{status}]"
+        summary = f"No matches found for {target} ({start_date} to {end_date})."
+    else:
+        log.info("tool.scrape_matches.done", matches_found=len(matches))
+        summary = _summarize_matches(matches, start_date, end_date)
+
+    if key:
+        scrape_cache.store(
+            Path(settings.scrape_cache_dir),
+            key,
+            {"rows": [row.to_dict() for row in built], "summary": summary},
         )
-
-    logger.info("tool.scrape_matches.done", matches_found=len(matches))
-    return "\n".join(lines)
+    # Accumulate last: a retry after anything above raises must not add the rows twice
+    ctx.deps._scraped_matches += built
+    return summary
 
 
 async def submit_matches(ctx: RunContext[AgentDeps]) -> str:
@@ -204,28 +240,148 @@ async def submit_matches(ctx: RunContext[AgentDeps]) -> str:
         logger.info("tool.submit_matches.dry_run", count=len(matches))
         return f"[DRY RUN] Would submit {len(matches)} matches to queue."
 
-    submitted = 0
-    errors = 0
-    for match_dict in matches:
-        try:
-            ctx.deps.queue_client.submit_match(match_dict)
-            submitted += 1
-        except Exception as exc:
-            errors += 1
-            logger.warning(
-                "tool.submit_matches.error",
-                match=f"{match_dict['home_team']} vs {match_dict['away_team']}",
-                error=str(exc),
-            )
+    submitted, error_records = await _submit_rows(ctx.deps.queue_client, matches)
+    errors = len(error_records)
+    if errors:
+        # One aggregated warning instead of a log write per failed match
+        logger.warning("tool.submit_matches.errors", details=error_records[:20], total=errors)
 
     logger.info("tool.submit_matches.done", submitted=submitted, errors=errors)
     return f"Submitted {submitted} matches to queue ({errors} errors)."
 
 
+def _build_match_rows(
+    matches: list[Match], config: ScrapingConfig, *, team_filter: str = ""
+) -> list[MatchRow]:
+    """Normalize scraped matches into MatchRows for the missing-table backend.
+
+    When team_filter is set, only matches involving that (normalized) team are
+    built — filtering happens in the same pass so discarded rows are never
+    materialized.
+    """
+    # For MT backend: division field stores the conference name for Academy league
+    # (MT has no separate conference field — "New England" is a division in Academy)
+    mt_division = config.conference if config.conference else config.division
+    season = _current_season()
+    name_map = _team_name_map(config.league)
+    rows: list[MatchRow] = []
+    for m in matches:
+        home = _normalize_team_name(m.home_team, mapping=name_map)
+        away = _normalize_team_name(m.away_team, mapping=name_map)
+        if team_filter and team_filter not in (home, away):
+            continue
+        rows.append(
+            MatchRow(
+                home_team=home,
+                away_team=away,
+                match_date=m.match_datetime.date().isoformat(),
+                match_time=m.match_datetime.strftime("%H:%M")
+                if m.match_datetime.hour or m.match_datetime.minute
+                else None,
+                season=season,
+                age_group=config.age_group,
+                division=mt_division,
+                league=config.league,
+                home_score=m.home_score if isinstance(m.home_score, int) else None,
+                away_score=m.away_score if isinstance(m.away_score, int) else None,
+                match_status=m.match_status,
+                external_match_id=m.match_id,
+                location=m.location,
+            )
+        )
+    return rows
+
+
+def _summarize_matches(matches: list[Match], start_date: str, end_date: str) -> str:
+    """Build the human-readable scrape summary for the LLM.
+
+    Lists the first _SUMMARY_HEAD and last _SUMMARY_TAIL matches; anything in
+    between is replaced by a single "omitted" line.
+    """
+    omitted = len(matches) - _SUMMARY_HEAD - _SUMMARY_TAIL
+    buf = io.StringIO()
+    buf.write(f"Found {len(matches)} matches ({start_date} to {end_date}):")
+    if omitted > 0:
+        _write_summary_lines(buf, matches[:_SUMMARY_HEAD])
+        buf.write(f"\n  ... ({omitted} more omitted) ...")
+        _write_summary_lines(buf, matches[-_SUMMARY_TAIL:])
+    else:
+        _write_summary_lines(buf, matches)
+    return buf.getvalue()
+
+
+def _write_summary_lines(buf: io.StringIO, matches: list[Match]) -> None:
+    """Append one summary line per match to buf."""
+    for m in matches:
+        score = f" ({m.home_score}-{m.away_score})" if m.has_score() else ""
+        buf.write(
+            f"\n  {m.match_datetime.date()} | {m.home_team} vs {m.away_team}{score}"
+            f" [{m.match_status}]"
+        )
+
+
+async def _submit_rows(
+    queue_client: MatchQueueClient, rows: list[MatchRow]
+) -> tuple[int, list[str]]:
+    """Publish rows to the queue.
+
+    submit_match validates each message against MatchData before sending, so a
+    row the schema rejects fails like any other publish error.
+
+    Returns:
+        (submitted, error_records) — how many messages were published, and a
+        "home vs away: reason" line for each row that failed.
+    """
+    payloads = [row.to_dict() for row in rows]
+    results = await _publish_batch(queue_client, payloads)
+    error_records = [
+        f"{payload['home_team']} vs {payload['away_team']}: {error}"
+        for payload, error in zip(payloads, results, strict=True)
+        if error is not None
+    ]
+    return len(payloads) - len(error_records), error_records
+
+
+async def _publish_batch(
+    queue_client: MatchQueueClient, payloads: list[dict[str, Any]]
+) -> list[BaseException | None]:
+    """Publish a batch of match payloads and return one status per message, in order.
+
+    MatchQueueClient (mls-match-scraper) only exposes a blocking, single-message
+    submit_match and makes no thread-safety promise, so the whole batch is
+    published sequentially on one worker thread — the event loop stays free and
+    the client is never shared across threads. Failures are collected rather
+    than raised: each status is None on success or the exception that message
+    failed with.
+    """
+    return await asyncio.to_thread(_publish_sequential, queue_client, payloads)
+
+
+def _publish_sequential(
+    queue_client: MatchQueueClient, payloads: list[dict[str, Any]]
+) -> list[BaseException | None]:
+    """Blocking body of _publish_batch — submit each payload in order."""
+    results: list[BaseException | None] = []
+    for payload in payloads:
+        try:
+            queue_client.submit_match(payload)
+        except Exception as exc:
+            results.append(exc)
+        else:
+            results.append(None)
+    return results
+
+
 def _current_season() -> str:
-    """Return the current season string (e.g. '2025-26')."""
+    """Return the current season string (e.g. '2025-26'), cached per calendar day."""
+    global _season_cache
     today = date.today()
+    if _season_cache[0] == today:
+        return _season_cache[1]
     # Season starts in August: Aug 2025 → "2025-26", Jan 2026 → "2025-26"
     if today.month >= 8:
-        return f"{today.year}-{str(today.year + 1)[2:]}"
-    return f"{today.year - 1}-{str(today.year)[2:]}"
+        season = f"{today.year}-{str(today.year + 1)[2:]}"
+    else:
+        season = f"{today.year - 1}-{str(today.year)[2:]}"
+    _season_cache = (today, season)
+    return season
@@ -2,19 +2,105 @@
 
 from __future__ import annotations
 
-import uuid
-from typing import TYPE_CHECKING, Annotated
+import asyncio
+import atexit
+import contextlib
+import secrets
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType, ModuleType
+from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
 import typer
 
 if TYPE_CHECKING:
+    import httpx
+    from src.celery.queue_client import MatchQueueClient
+
     from config.settings import AgentSettings
 
 app = typer.Typer(name="match-scraper-agent", no_args_is_help=True)
 logger = structlog.get_logger()
 
 
+# httpx, imported on first use so `--help` and `scrape` don't pay for it
+_httpx: ModuleType | None = None
+
+
+def _lazy_httpx() -> ModuleType:
+    """Return the httpx module, importing it on first call."""
+    global _httpx
+    if _httpx is None:
+        import httpx
+
+        _httpx = httpx
+    return _httpx
+
+
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when it is installed, else None (stdlib loop)."""
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+# Shared keep-alive client for proxy /status probes
+_PROBE_CLIENT: httpx.Client | None = None
+
+
+def _probe_client() -> httpx.Client:
+    """Return the shared probe client, creating it (and its exit hook) on first call."""
+    global _PROBE_CLIENT
+    if _PROBE_CLIENT is None:
+        httpx = _lazy_httpx()
+        _PROBE_CLIENT = httpx.Client(
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=2, keepalive_expiry=30.0),
+        )
+        atexit.register(_PROBE_CLIENT.close)
+    return _PROBE_CLIENT
+
+
+# Exact exception type → diagnostic builder for _classify_error. Built on first
+# use; insertion order is the precedence for the isinstance fallback.
+_ERR_HANDLERS: dict[type[BaseException], Callable[[Any, str], str]] = {}
+# Same classes as one tuple, so unrelated exceptions fail a single isinstance
+_ERR_CLASSES: tuple[type[BaseException], ...] = ()
+
+
+def _error_handlers() -> dict[type[BaseException], Callable[[Any, str], str]]:
+    """Return the _classify_error dispatch table, populating it on first call."""
+    global _ERR_CLASSES
+    if not _ERR_HANDLERS:
+        from anthropic import APIConnectionError, APIStatusError, AuthenticationError
+
+        def unreachable(_: BaseException, proxy_url: str) -> str:
+            return f"Cannot reach proxy at {proxy_url} — is the iron-claw proxy running?"
+
+        def auth_failed(_: BaseException, __: str) -> str:
+            return "Authentication failed — check AGENT_ANTHROPIC_API_KEY or proxy auth config"
+
+        def api_status(exc: APIStatusError, _: str) -> str:
+            return f"API error {exc.status_code}: {exc.message}"
+
+        _ERR_HANDLERS.update(
+            {
+                _lazy_httpx().ConnectError: unreachable,
+                APIConnectionError: unreachable,
+                AuthenticationError: auth_failed,
+                APIStatusError: api_status,
+            }
+        )
+        _ERR_CLASSES = tuple(_ERR_HANDLERS)
+    return _ERR_HANDLERS
+
+
 def _classify_error(exc: Exception, proxy_url: str) -> tuple[str, bool]:
     """Return a one-line diagnostic and whether the error is known.
 
@@ -22,123 +108,150 @@ def _classify_error(exc: Exception, proxy_url: str) -> tuple[str, bool]:
         (message, known) — known=True means the diagnostic is sufficient,
         no traceback needed.
     """
-    import httpx
-    from anthropic import APIConnectionError, APIStatusError, AuthenticationError
+    handlers = _error_handlers()
 
     # Walk the full cause chain once
     chain: BaseException | None = exc
     while chain is not None:
-        if isinstance(chain, (httpx.ConnectError, APIConnectionError)):
-            return (
-                f"Cannot reach proxy at {proxy_url} — is the iron-claw proxy running?",
-                True,
-            )
-        if isinstance(chain, AuthenticationError):
-            return (
-                "Authentication failed — check AGENT_ANTHROPIC_API_KEY or proxy auth config",
-                True,
-            )
-        if isinstance(chain, APIStatusError):
-            return f"API error {chain.status_code}: {chain.message}", True
-        chain = getattr(chain, "__cause__", None)
+        handler = handlers.get(type(chain))
+        if handler is None and isinstance(chain, _ERR_CLASSES):
+            # Subclasses (e.g. APITimeoutError) miss the exact-type lookup
+            handler = next((h for cls, h in handlers.items() if isinstance(chain, cls)), None)
+        if handler is not None:
+            return handler(chain, proxy_url), True
+        chain = chain.__cause__
 
     # Truly unexpected — caller should log the traceback
     return str(exc), False
 
 
-# Target → scraper config (age_group, league, division, conference, club)
-_TARGET_SCRAPER_CONFIG: dict[str, dict[str, str]] = {
-    "u14-hg": {
-        "age_group": "U14",
-        "league": "Homegrown",
-        "division": "Northeast",
-    },
-    "u14-hg-ifa": {
-        "age_group": "U14",
-        "league": "Homegrown",
-        "division": "Northeast",
-    },
-    "u13-hg": {
-        "age_group": "U13",
-        "league": "Homegrown",
-        "division": "Northeast",
-    },
-    "u13-hg-ifa": {
-        "age_group": "U13",
-        "league": "Homegrown",
-        "division": "Northeast",
-    },
-    "u14-academy": {
-        "age_group": "U14",
-        "league": "Academy",
-        "conference": "New England",
-    },
-    "u14-academy-ifa": {
-        "age_group": "U14",
-        "league": "Academy",
-        "conference": "New England",
-    },
-    "u14-hg-florida": {
-        "age_group": "U14",
-        "league": "Homegrown",
-        "division": "Florida",
-    },
-    "u13-hg-florida": {
-        "age_group": "U13",
-        "league": "Homegrown",
-        "division": "Florida",
-    },
-}
-
-_TARGET_PROMPTS: dict[str, str] = {
-    "u14-hg": ("Only scrape U14 Homegrown Northeast today. Do not scrape other targets."),
-    "u14-hg-ifa": (
-        "Only scrape U14 Homegrown Northeast today. "
-        "Only IFA matches will be submitted. Do not scrape other targets."
-    ),
-    "u13-hg": ("Only scrape U13 Homegrown Northeast today. Do not scrape other targets."),
-    "u13-hg-ifa": (
-        "Only scrape U13 Homegrown Northeast today. "
-        "Only IFA matches will be submitted. Do not scrape other targets."
-    ),
-    "u14-academy": (
-        "Only scrape U14 Academy New England (conference='New England') today. "
-        "Do not scrape other targets."
-    ),
-    "u14-academy-ifa": (
-        "Only scrape U14 Academy New England (conference='New England') today. "
-        "Only IFA Academy matches will be submitted. Do not scrape other targets."
-    ),
-    "u14-hg-florida": (
-        "Only scrape U14 Homegrown Florida (division='Florida') today. "
-        "Do not scrape other targets."
-    ),
-    "u13-hg-florida": (
-        "Only scrape U13 Homegrown Florida (division='Florida') today. "
-        "Do not scrape other targets."
-    ),
-}
-
-# Targets that include a team filter — value is the DB team name used for filtering
-_TARGET_TEAM_FILTER: dict[str, str] = {
-    "u14-hg-ifa": "IFA",
-    "u13-hg-ifa": "IFA",
-    "u14-academy-ifa": "IFA Academy",
-}
-
-
-def _queue_client_kwargs(settings: AgentSettings) -> dict[str, str]:
-    """Build kwargs for MatchQueueClient based on settings.
-
-    If queue_name is set, publish directly to that queue.
-    Otherwise fall back to the exchange_name (fanout) behavior.
+@dataclass(slots=True, frozen=True)
+class TargetSpec:
+    """A --target: what to scrape, how to prompt the agent, and which team to keep.
+
+    team_filter is the DB team name used for filtering ("" keeps every match).
+    An empty division falls back to the configured default.
     """
-    kwargs: dict[str, str] = {"broker_url": settings.rabbitmq_url}
-    if settings.queue_name:
-        kwargs["queue_name"] = settings.queue_name
-    else:
-        kwargs["exchange_name"] = settings.exchange_name
-    return kwargs
+
+    prompt: str
+    age_group: str
+    league: str
+    division: str = ""
+    conference: str = ""
+    team_filter: str = ""
+
+    def __post_init__(self) -> None:
+        # Prompts and filters flow into every tool call; intern them once here
+        object.__setattr__(self, "prompt", sys.intern(self.prompt))
+        object.__setattr__(self, "team_filter", sys.intern(self.team_filter))
+
+
+# Read-only view: the table is fixed at import time
+_TARGETS: Mapping[str, TargetSpec] = MappingProxyType(
+    {
+        "u14-hg": TargetSpec(
+            prompt="Only scrape U14 Homegrown Northeast today. Do not scrape other targets.",
+            age_group="U14",
+            league="Homegrown",
+            division="Northeast",
+        ),
+        "u14-hg-ifa": TargetSpec(
+            prompt=(
+                "Only scrape U14 Homegrown Northeast today. "
+                "Only IFA matches will be submitted. Do not scrape other targets."
+            ),
+            age_group="U14",
+            league="Homegrown",
+            division="Northeast",
+            team_filter="IFA",
+        ),
+        "u13-hg": TargetSpec(
+            prompt="Only scrape U13 Homegrown Northeast today. Do not scrape other targets.",
+            age_group="U13",
+            league="Homegrown",
+            division="Northeast",
+        ),
+        "u13-hg-ifa": TargetSpec(
+            prompt=(
+                "Only scrape U13 Homegrown Northeast today. "
+                "Only IFA matches will be submitted. Do not scrape other targets."
+            ),
+            age_group="U13",
+            league="Homegrown",
+            division="Northeast",
+            team_filter="IFA",
+        ),
+        "u14-academy": TargetSpec(
+            prompt=(
+                "Only scrape U14 Academy New England (conference='New England') today. "
+                "Do not scrape other targets."
+            ),
+            age_group="U14",
+            league="Academy",
+            conference="New England",
+        ),
+        "u14-academy-ifa": TargetSpec(
+            prompt=(
+                "Only scrape U14 Academy New England (conference='New England') today. "
+                "Only IFA Academy matches will be submitted. Do not scrape other targets."
+            ),
+            age_group="U14",
+            league="Academy",
+            conference="New England",
+            team_filter="IFA Academy",
+        ),
+        "u14-hg-florida": TargetSpec(
+            prompt=(
+                "Only scrape U14 Homegrown Florida (division='Florida') today. "
+                "Do not scrape other targets."
+            ),
+            age_group="U14",
+            league="Homegrown",
+            division="Florida",
+        ),
+        "u13-hg-florida": TargetSpec(
+            prompt=(
+                "Only scrape U13 Homegrown Florida (division='Florida') today. "
+                "Do not scrape other targets."
+            ),
+            age_group="U13",
+            league="Homegrown",
+            division="Florida",
+        ),
+    }
+)
+_TARGET_KEYS = frozenset(_TARGETS)
+_VALID_TARGETS_STR = ", ".join(sorted(_TARGETS))
+
+
+# Pooled MatchQueueClients keyed by (rabbitmq_url, queue_name, exchange_name)
+_QUEUE_CLIENTS: dict[tuple[str, str, str], MatchQueueClient] = {}
+
+
+def _get_queue_client(settings: AgentSettings) -> MatchQueueClient:
+    """Return the pooled MatchQueueClient for the settings' broker and destination.
+
+    Commands run in the same process (tests, scripts) share one client and its
+    broker connection instead of reconnecting.
+    """
+    key = (settings.rabbitmq_url, settings.queue_name, settings.exchange_name)
+    client = _QUEUE_CLIENTS.get(key)
+    if client is None:
+        from src.celery.queue_client import MatchQueueClient
+
+        client = MatchQueueClient(**settings.queue_client_kwargs)
+        _QUEUE_CLIENTS[key] = client
+    return client
+
+
+@atexit.register
+def _close_queue_clients() -> None:
+    """Close pooled clients at interpreter exit (best effort)."""
+    for client in _QUEUE_CLIENTS.values():
+        close = getattr(client, "close", None)
+        if close is not None:
+            with contextlib.suppress(Exception):
+                close()
 
 
 def _proxy_preflight(settings: AgentSettings) -> str:
@@ -146,7 +259,8 @@ def _proxy_preflight(settings: AgentSettings) -> str:
 
     Hits GET /status on the proxy. If RADIUS is active, validates the token
     budget and returns the model allowed by the RADIUS session. If bare mode
-    (no RADIUS), returns the configured model. Exits on unreachable proxy or
+    (no RADIUS), returns the configured model — proxies that send
+    ``X-IronClaw-Bare: 1`` skip the JSON decode. Exits on unreachable proxy or
     exhausted budget.
 
     Args:
@@ -158,15 +272,13 @@ def _proxy_preflight(settings: AgentSettings) -> str:
     Raises:
         typer.Exit: If the proxy is unreachable or budget is exhausted.
     """
-    import httpx
+    httpx = _lazy_httpx()
 
-    base = settings.proxy_base_url.rstrip("/")
-    status_url = base.replace("/v1", "") + "/status"
+    status_url = settings.status_url
 
     try:
-        resp = httpx.get(status_url, timeout=5)
+        resp = _probe_client().get(status_url)
         resp.raise_for_status()
-        data = resp.json()
     except (httpx.ConnectError, httpx.TimeoutException) as exc:
         logger.error("preflight.proxy_unreachable", url=status_url, error=str(exc))
         raise typer.Exit(code=1) from None
@@ -174,7 +286,14 @@ def _proxy_preflight(settings: AgentSettings) -> str:
         logger.error("preflight.proxy_error", url=status_url, status=exc.response.status_code)
         raise typer.Exit(code=1) from None
 
-    # Bare mode — proxy is up but no RADIUS session
+    # Bare mode advertised in a header — no need to decode the body
+    if resp.headers.get("x-ironclaw-bare") == "1":
+        logger.info("preflight.bare_mode", proxy=status_url)
+        return settings.model_name
+
+    data = resp.json()
+
+    # Bare mode — proxy is up but no RADIUS session (proxies without the header)
     if data.get("no_radius_session"):
         logger.info("preflight.bare_mode", proxy=status_url)
         return settings.model_name
@@ -228,14 +347,12 @@ def run(
     ] = False,
 ) -> None:
     """Run the match-scraper agent."""
-    from src.celery.queue_client import MatchQueueClient
-
     from agent.core import create_agent
     from agent.deps import AgentDeps
-    from config.settings import AgentSettings, env_file_path
-    from utils.logger import configure_logging
+    from config.settings import load_settings
+    from utils.logger import configure_logging, flush_logs
 
-    settings = AgentSettings(_env_file=env_file_path(env))
+    settings = load_settings(env)
     if model:
         settings.model_name = model
     if proxy_url:
@@ -245,81 +362,91 @@ def run(
     if dry_run:
         settings.dry_run = True
 
-    configure_logging(json_output=json_logs or settings.json_logs, log_level=settings.log_level)
-
-    # Bind run_id and env to all log lines for this invocation
-    run_id = uuid.uuid4().hex[:12]
-    structlog.contextvars.bind_contextvars(run_id=run_id, env=env)
-
-    # Proxy preflight — validate budget and resolve model from RADIUS
-    if settings.proxy_enabled:
-        preflight_model = _proxy_preflight(settings)
-        if preflight_model != settings.model_name:
-            logger.info(
-                "preflight.model_override",
-                configured=settings.model_name,
-                using=preflight_model,
-            )
-            settings.model_name = preflight_model
-
-    logger.info(
-        "agent.starting",
-        model=settings.model_name,
-        proxy=settings.proxy_base_url,
-        proxy_enabled=settings.proxy_enabled,
-        dry_run=settings.dry_run,
+    configure_logging(
+        json_output=json_logs or settings.json_logs,
+        log_level=settings.log_level,
+        background=True,
     )
 
+    if target is not None and target not in _TARGET_KEYS:
+        typer.echo(f"Unknown target '{target}'. Valid targets: {_VALID_TARGETS_STR}", err=True)
+        raise typer.Exit(code=1)
+
+    # Flush on every exit path — typer.Exit included — not just after a successful run
     try:
-        agent = create_agent(settings)
-        queue_client = MatchQueueClient(**_queue_client_kwargs(settings))
-        if target and target not in _TARGET_PROMPTS:
-            valid = ", ".join(sorted(_TARGET_PROMPTS))
-            typer.echo(f"Unknown target '{target}'. Valid targets: {valid}", err=True)
-            raise typer.Exit(code=1)
+        # Bind run_id and env to all log lines for this invocation; unbound on any exit
+        run_id = secrets.token_hex(6)
+        with structlog.contextvars.bound_contextvars(run_id=run_id, env=env):
+            # Proxy preflight — validate budget and resolve model from RADIUS
+            if settings.proxy_enabled:
+                preflight_model = _proxy_preflight(settings)
+                if preflight_model != settings.model_name:
+                    logger.info(
+                        "preflight.model_override",
+                        configured=settings.model_name,
+                        using=preflight_model,
+                    )
+                    settings.model_name = preflight_model
 
-        team_filter = _TARGET_TEAM_FILTER.get(target or "", "")
-        deps = AgentDeps(
-            queue_client=queue_client,
-            settings=settings,
-            dry_run=settings.dry_run,
-            headless=settings.headless,
-            team_filter=team_filter,
-        )
+            logger.info(
+                "agent.starting",
+                model=settings.model_name,
+                proxy=settings.proxy_base_url,
+                proxy_enabled=settings.proxy_enabled,
+                dry_run=settings.dry_run,
+            )
 
-        if target:
-            user_prompt = _TARGET_PROMPTS[target]
-            logger.info("agent.target_filter", target=target, team_filter=team_filter or None)
-        else:
-            user_prompt = "Review today's matches and take appropriate actions."
+            try:
+                agent = create_agent(settings)
+                queue_client = _get_queue_client(settings)
+                spec = _TARGETS[target] if target is not None else None
+                team_filter = spec.team_filter if spec else ""
+                deps = AgentDeps(
+                    queue_client=queue_client,
+                    settings=settings,
+                    dry_run=settings.dry_run,
+                    headless=settings.headless,
+                    team_filter=team_filter,
+                )
 
-        result = agent.run_sync(user_prompt, deps=deps)
-    except Exception as exc:
-        message, known = _classify_error(exc, settings.proxy_base_url)
-        logger.error("agent.failed", error=message)
-        if not known:
-            logger.error("agent.failed.trace", exc_info=exc)
-        raise typer.Exit(code=1) from None
+                if spec:
+                    user_prompt = spec.prompt
+                    logger.info(
+                        "agent.target_filter", target=target, team_filter=team_filter or None
+                    )
+                else:
+                    user_prompt = "Review today's matches and take appropriate actions."
 
-    logger.info(
-        "agent.completed",
-        summary=result.output.summary,
-        actions=len(result.output.actions),
-        matches_found=result.output.matches_found,
-        matches_submitted=result.output.matches_submitted,
-        requests=result.usage().requests,
-        tokens=result.usage().total_tokens,
-    )
+                result = agent.run_sync(user_prompt, deps=deps)
+            except Exception as exc:
+                message, known = _classify_error(exc, settings.proxy_base_url)
+                logger.error("agent.failed", error=message)
+                if not known:
+                    logger.error("agent.failed.trace", exc_info=exc)
+                raise typer.Exit(code=1) from None
 
-    if json_logs or settings.json_logs:
-        print(result.output.model_dump_json(indent=2))
-    else:
-        typer.echo(f"\n{result.output.summary}")
-        for action in result.output.actions:
-            prefix = "[DRY RUN] " if action.dry_run else ""
-            typer.echo(f"  {prefix}{action.action}: {action.detail}")
+            usage = result.usage()
+            logger.info(
+                "agent.completed",
+                summary=result.output.summary,
+                actions=len(result.output.actions),
+                matches_found=result.output.matches_found,
+                matches_submitted=result.output.matches_submitted,
+                requests=usage.requests,
+                tokens=usage.total_tokens,
+            )
+            flush_logs()
 
-    structlog.contextvars.unbind_contextvars("run_id", "env")
+            if json_logs or settings.json_logs:
+                print(result.output.model_dump_json(indent=2))
+            else:
+                lines = [f"\n{result.output.summary}"]
+                for action in result.output.actions:
+                    prefix = "[DRY RUN] " if action.dry_run else ""
+                    lines.append(f"  {prefix}{action.action}: {action.detail}")
+                typer.echo("\n".join(lines))
+    finally:
+        flush_logs()
 
 
 @app.command()
@@ -330,28 +457,29 @@ def check(
     ] = None,
 ) -> None:
     """Check proxy health and RabbitMQ connectivity."""
-    import httpx
+    httpx = _lazy_httpx()
 
-    from config.settings import AgentSettings, env_file_path
+    from config.settings import load_settings
     from utils.logger import configure_logging
 
     configure_logging(json_output=False)
 
-    settings = AgentSettings(_env_file=env_file_path(env))
+    settings = load_settings(env)
     if proxy_url:
         settings.proxy_base_url = proxy_url
 
     typer.echo(f"environment: {env}")
 
     # Check proxy
-    base = settings.proxy_base_url.rstrip("/")
-    status_url = base.replace("/v1", "") + "/status"
+    status_url = settings.status_url
     typer.echo(f"proxy: checking {status_url}")
     try:
-        resp = httpx.get(status_url, timeout=5)
-        typer.echo(f"  status: {resp.status_code}")
-        if resp.status_code == 200:
-            typer.echo(f"  response: {resp.text[:200]}")
+        # Only the first 200 bytes are shown — don't download the rest
+        with _probe_client().stream("GET", status_url) as resp:
+            typer.echo(f"  status: {resp.status_code}")
+            if resp.status_code == 200:
+                head = next(resp.iter_bytes(200), b"")
+                typer.echo(f"  response: {head.decode('utf-8', 'replace')}")
     except httpx.ConnectError:
         typer.echo("  status: UNREACHABLE")
     except httpx.TimeoutException:
@@ -360,9 +488,7 @@ def check(
     # Check RabbitMQ
     typer.echo(f"rabbitmq: checking {settings.rabbitmq_url}")
     try:
-        from src.celery.queue_client import MatchQueueClient
-
-        client = MatchQueueClient(**_queue_client_kwargs(settings))
+        client = _get_queue_client(settings)
         if client.check_connection():
             typer.echo("  status: connected")
         else:
@@ -395,30 +521,24 @@ def scrape(
     ] = False,
 ) -> None:
     """Scrape matches directly — no LLM, no API key, no proxy needed."""
-    import asyncio
     from datetime import date
 
     from src.scraper.config import ScrapingConfig
     from src.scraper.mls_scraper import MLSScraper
 
-    from agent.tools import (
-        SEASON_END,
-        _current_season,
-        _normalize_team_name,
-    )
-    from config.settings import AgentSettings, env_file_path
+    from agent.tools import SEASON_END, _build_match_rows, _submit_rows
+    from config.settings import load_settings
     from utils.logger import configure_logging
 
     configure_logging(json_output=False)
 
-    if target not in _TARGET_SCRAPER_CONFIG:
-        valid = ", ".join(sorted(_TARGET_SCRAPER_CONFIG))
-        typer.echo(f"Unknown target '{target}'. Valid targets: {valid}", err=True)
+    if target not in _TARGET_KEYS:
+        typer.echo(f"Unknown target '{target}'. Valid targets: {_VALID_TARGETS_STR}", err=True)
         raise typer.Exit(code=1)
+    spec = _TARGETS[target]
 
-    settings = AgentSettings(_env_file=env_file_path(env))
-    target_cfg = _TARGET_SCRAPER_CONFIG[target]
-    team_filter = _TARGET_TEAM_FILTER.get(target, "")
+    settings = load_settings(env)
+    team_filter = spec.team_filter
 
     try:
         start = date.fromisoformat(from_date) if from_date else date.today()
@@ -428,10 +548,10 @@ def scrape(
         raise typer.Exit(code=1) from None
 
     config = ScrapingConfig(
-        age_group=target_cfg.get("age_group", settings.age_group),
-        league=target_cfg.get("league", settings.league),
-        division=target_cfg.get("division", settings.division),
-        conference=target_cfg.get("conference", ""),
+        age_group=spec.age_group,
+        league=spec.league,
+        division=spec.division or settings.division,
+        conference=spec.conference,
         club="",
         start_date=start,
         end_date=end,
@@ -447,71 +567,35 @@ def scrape(
         label += f" {config.division}"
     typer.echo(f"Scraping {label} ({start} to {end})...")
 
-    scraper = MLSScraper(config, headless=True)
-    matches = asyncio.run(scraper.scrape_matches())
-
-    if not matches:
-        typer.echo("No matches found.")
-        raise typer.Exit(code=0)
-
-    # Build match dicts (same logic as the agent tool)
-    mt_division = config.conference if config.conference else config.division
-    built = [
-        {
-            "home_team": _normalize_team_name(m.home_team, league=config.league),
-            "away_team": _normalize_team_name(m.away_team, league=config.league),
-            "match_date": m.match_datetime.date().isoformat(),
-            "match_time": m.match_datetime.strftime("%H:%M")
-            if m.match_datetime.hour or m.match_datetime.minute
-            else None,
-            "season": _current_season(),
-            "age_group": config.age_group,
-            "match_type": "League",
-            "division": mt_division,
-            "league": config.league,
-            "home_score": m.home_score if isinstance(m.home_score, int) else None,
-            "away_score": m.away_score if isinstance(m.away_score, int) else None,
-            "match_status": m.match_status,
-            "external_match_id": m.match_id,
-            "location": m.location,
-            "source": "match-scraper-agent",
-        }
-        for m in matches
-    ]
-
-    # Apply team filter
-    if team_filter:
-        built = [m for m in built if team_filter in (m["home_team"], m["away_team"])]
-
-    if json_output:
-        import json
-
-        print(json.dumps(built, indent=2))
-    else:
-        typer.echo(f"\nFound {len(matches)} matches ({len(built)} after filtering):\n")
-        for m in built:
-            has_score = m["home_score"] is not None
-            score = f" ({m['home_score']}-{m['away_score']})" if has_score else ""
-            typer.echo(
-                f"  {m['match_date']} | {m['home_team']} vs {m['away_team']}"
-                f"{score} [{m['match_status']}]"
-            )
+    # One loop for scrape and submit; uvloop when available
+    with asyncio.Runner(loop_factory=_event_loop_factory()) as runner:
+        scraper = MLSScraper(config, headless=True)
+        matches = runner.run(scraper.scrape_matches())
 
-    if submit:
-        from src.celery.queue_client import MatchQueueClient
+        if not matches:
+            typer.echo("No matches found.")
+            raise typer.Exit(code=0)
 
-        queue_client = MatchQueueClient(**_queue_client_kwargs(settings))
-        submitted = 0
-        errors = 0
-        for match_dict in built:
-            try:
-                queue_client.submit_match(match_dict)
-                submitted += 1
-            except Exception as exc:
-                errors += 1
-                logger.warning(
-                    "scrape.submit_error",
-                    match=f"{match_dict['home_team']} vs {match_dict['away_team']}",
-                    error=str(exc),
+        # Build match rows, applying the team filter (same logic as the agent tool)
+        built = _build_match_rows(matches, config, team_filter=team_filter)
+
+        if json_output:
+            import json
+
+            json.dump([m.to_dict() for m in built], sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            typer.echo(f"\nFound {len(matches)} matches ({len(built)} after filtering):\n")
+            for m in built:
+                score = f" ({m.home_score}-{m.away_score})" if m.home_score is not None else ""
+                typer.echo(
+                    f"  {m.match_date} | {m.home_team} vs {m.away_team}{score} [{m.match_status}]"
                 )
-        typer.echo(f"\nSubmitted {submitted} matches to queue ({errors} errors).")
+
+        if submit:
+            queue_client = _get_queue_client(settings)
+            submitted, error_records = runner.run(_submit_rows(queue_client, built))
+            errors = len(error_records)
+            if errors:
+                logger.warning("scrape.submit_errors", details=error_records[:20], total=errors)
+            typer.echo(f"\nSubmitted {submitted} matches to queue ({errors} errors).")
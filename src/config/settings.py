@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings
 
 ENVS_DIR = Path(__file__).resolve().parents[2] / "envs"
+# Containers ship without envs/ — settle that once instead of per lookup
+_ENVS_IS_DIR = ENVS_DIR.is_dir()
 
 
+@lru_cache(maxsize=8)
 def env_file_path(env: str) -> Path | None:
     """Resolve the dotenv file for a given environment name.
 
@@ -19,8 +24,10 @@ def env_file_path(env: str) -> Path | None:
         Path to envs/.env.<env>, or None if it doesn't exist (e.g. in a
         container where settings come from environment variables).
     """
+    if not _ENVS_IS_DIR:
+        return None
     path = ENVS_DIR / f".env.{env}"
-    if not path.is_file():
+    if not os.path.isfile(path):
         return None
     return path
 
@@ -49,6 +56,10 @@ class AgentSettings(BaseSettings):
     min_token_budget: int = 5000
     dry_run: bool = False
     headless: bool = True
+    scrape_concurrency: int = 1
+    scrape_cache_enabled: bool = False
+    scrape_cache_dir: str = ".scrape_cache"
+    scrape_cache_ttl: int = 600
     json_logs: bool = False
     log_level: str = "info"
 
@@ -58,3 +69,62 @@ class AgentSettings(BaseSettings):
     db_user: str = "postgres"
     db_password: str = "postgres"
     db_name: str = "postgres"
+
+    @classmethod
+    def default_unvalidated(cls) -> AgentSettings:
+        """Return settings holding the declared defaults, skipping env/dotenv and validation.
+
+        For tests: the defaults are literals, so there is nothing to validate, and
+        the result doesn't depend on AGENT_* variables in the caller's shell.
+        """
+        return cls.model_construct()
+
+    @cached_property
+    def status_url(self) -> str:
+        """iron-claw GET /status endpoint, derived from proxy_base_url.
+
+        Computed on first access — apply any proxy_base_url override before then.
+        """
+        return self.proxy_base_url.rstrip("/").replace("/v1", "") + "/status"
+
+    @cached_property
+    def queue_client_kwargs(self) -> dict[str, str]:
+        """Keyword arguments for MatchQueueClient.
+
+        If queue_name is set, publish directly to that queue.
+        Otherwise fall back to the exchange_name (fanout) behavior.
+        """
+        if self.queue_name:
+            return {"broker_url": self.rabbitmq_url, "queue_name": self.queue_name}
+        return {"broker_url": self.rabbitmq_url, "exchange_name": self.exchange_name}
+
+
+@lru_cache(maxsize=8)
+def _parse_settings(
+    env_file: Path | None, mtime: float, agent_environ: tuple[tuple[str, str], ...]
+) -> AgentSettings:
+    """Parse settings once per (dotenv file, mtime, AGENT_* environment).
+
+    mtime invalidates on edit; agent_environ because env vars take precedence
+    over the dotenv file and may change in-process (CliRunner env=, monkeypatch).
+    """
+    return AgentSettings(_env_file=env_file)
+
+
+def load_settings(env: str) -> AgentSettings:
+    """Load settings for an environment, parsing its dotenv file once per process.
+
+    Args:
+        env: Environment name (e.g. "local", "prod").
+
+    Returns:
+        A copy of the cached settings, so per-command overrides (--model,
+        --proxy-url, ...) never leak into later commands in the same process.
+    """
+    env_file = env_file_path(env)
+    mtime = env_file.stat().st_mtime if env_file else 0.0
+    # Env var names match case-insensitively, like AgentSettings does
+    agent_environ = tuple(
+        sorted((k, v) for k, v in os.environ.items() if k.upper().startswith("AGENT_"))
+    )
+    return _parse_settings(env_file, mtime, agent_environ).model_copy()
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
+import os
+import queue
+import socket
+import sys
+import threading
+from typing import BinaryIO
 
+import orjson
 import structlog
 
 LOG_LEVEL_MAP: dict[str, int] = {
@@ -14,35 +23,168 @@ LOG_LEVEL_MAP: dict[str, int] = {
 }
 
 
-def configure_logging(*, json_output: bool = False, log_level: str = "info") -> None:
+# Resolved once at import — constant for the life of the process
+_STATIC_FIELDS: dict[str, str | int] = {"host": socket.gethostname(), "pid": os.getpid()}
+
+
+def _add_static_fields(_: object, __: str, event_dict: dict) -> dict:
+    """Stamp host and pid on each JSON record (for log aggregation across pods).
+
+    Values a caller already bound under the same keys win.
+    """
+    for key, value in _STATIC_FIELDS.items():
+        event_dict.setdefault(key, value)
+    return event_dict
+
+
+_BASE = (
+    structlog.contextvars.merge_contextvars,
+    structlog.processors.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+)
+_STACK_INFO = structlog.processors.StackInfoRenderer()
+
+# JSONRenderer needs format_exc_info to serialize tracebacks. orjson renders
+# straight to bytes, which the BytesLogger writes without re-encoding.
+_JSON_TAIL = (
+    _add_static_fields,
+    structlog.processors.format_exc_info,
+    structlog.processors.JSONRenderer(serializer=orjson.dumps),
+)
+
+# ConsoleRenderer handles exc_info natively — adding format_exc_info
+# before it causes a duplicate-rendering warning
+_CONSOLE_TAIL = (structlog.dev.ConsoleRenderer(),)
+
+
+@functools.cache
+def _processors_for(*, json_output: bool, debug: bool) -> tuple:
+    """Return the processor chain for a mode — one shared tuple per combination.
+
+    stack_info=True is only honoured at debug level; the renderer walks frames.
+    """
+    head = (*_BASE[:2], _STACK_INFO, *_BASE[2:]) if debug else _BASE
+    return head + (_JSON_TAIL if json_output else _CONSOLE_TAIL)
+
+
+class _QueuedWriter:
+    """File-like sink that hands rendered log lines to a background writer thread.
+
+    Rendering still happens on the caller; only the blocking stream write and
+    flush move off the event loop. Accepts both console (str) and orjson (bytes)
+    lines; str is encoded on the writer thread. The queue is drained at
+    interpreter exit.
+    """
+
+    def __init__(self, stream: BinaryIO, maxsize: int = 10_000) -> None:
+        self._stream = stream
+        self._stream_ok = True
+        self._queue: queue.Queue[str | bytes | None] = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._drain, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, data: str | bytes) -> int:
+        if self._thread.is_alive():
+            self._queue.put(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """No-op — the writer thread flushes after each line."""
+
+    def drain(self) -> None:
+        """Block until every line queued so far has been written."""
+        self._queue.join()
+
+    def retarget(self, stream: BinaryIO) -> None:
+        """Send later lines to stream, once everything queued so far has been written."""
+        self.drain()
+        self._stream = stream
+        self._stream_ok = True
+
+    def close(self) -> None:
+        """Stop the writer thread after it has drained everything queued so far."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+    def _drain(self) -> None:
+        while True:
+            data = self._queue.get()
+            try:
+                if data is None:
+                    return
+                if self._stream_ok:
+                    self._stream_ok = self._write(data)
+            finally:
+                # Always account for the line, or drain() (queue.join) never returns
+                self._queue.task_done()
+
+    def _write(self, data: str | bytes) -> bool:
+        """Write one line; return False once the stream is gone (closed, broken pipe)."""
+        try:
+            self._stream.write(data.encode() if isinstance(data, str) else data)
+            self._stream.flush()
+        except (OSError, ValueError):
+            # Nowhere left to log to (e.g. `run 2>&1 | head` exited) — drop the rest
+            return False
+        return True
+
+
+_queued_writer: _QueuedWriter | None = None
+
+
+def _get_queued_writer(stream: BinaryIO) -> _QueuedWriter:
+    """Return the process-wide queued writer, writing to stream.
+
+    The thread starts on first use. Later calls retarget the same writer, so
+    loggers cached against it follow the stream current at configure time.
+    """
+    global _queued_writer
+    if _queued_writer is None:
+        _queued_writer = _QueuedWriter(stream)
+    else:
+        _queued_writer.retarget(stream)
+    return _queued_writer
+
+
+def flush_logs() -> None:
+    """Wait for background log writes to land — call before printing final output."""
+    if _queued_writer is not None:
+        _queued_writer.drain()
+
+
+def configure_logging(
+    *, json_output: bool = False, log_level: str = "info", background: bool = False
+) -> None:
     """Configure structlog for match-scraper-agent.
 
+    Loggers are cached on first use, so call this before anything logs —
+    a module-level ``structlog.get_logger()`` proxy that logged earlier keeps
+    its old configuration. Context bound via ``structlog.contextvars`` still
+    reaches cached loggers: merge_contextvars reads it at log time.
+
     Args:
         json_output: If True, output JSON lines. If False, pretty console output.
-        log_level: Minimum log level (debug, info, warning, error).
+            Either way logs go to stderr, keeping stdout for command output.
+        log_level: Minimum log level (debug, info, warning, error). Only debug
+            renders ``stack_info=True`` stacks.
+        background: If True, log writes go through a queue to a dedicated
+            writer thread so async tool calls never block on stderr.
     """
     level = LOG_LEVEL_MAP.get(log_level.lower(), logging.INFO)
 
-    processors: list = [
-        structlog.contextvars.merge_contextvars,
-        structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.TimeStamper(fmt="iso"),
-    ]
-
     if json_output:
-        # JSONRenderer needs format_exc_info to serialize tracebacks
-        processors.append(structlog.processors.format_exc_info)
-        processors.append(structlog.processors.JSONRenderer())
+        sink = _get_queued_writer(sys.stderr.buffer) if background else sys.stderr.buffer
+        logger_factory = structlog.BytesLoggerFactory(file=sink)
     else:
-        # ConsoleRenderer handles exc_info natively — adding format_exc_info
-        # before it causes a duplicate-rendering warning
-        processors.append(structlog.dev.ConsoleRenderer())
+        sink = _get_queued_writer(sys.stderr.buffer) if background else sys.stderr
+        logger_factory = structlog.WriteLoggerFactory(file=sink)
 
     structlog.configure(
-        processors=processors,
+        processors=_processors_for(json_output=json_output, debug=level <= logging.DEBUG),
         wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
@@ -2,23 +2,68 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
 from config.settings import AgentSettings
 
+if TYPE_CHECKING:
+    from pydantic_ai.models.test import TestModel
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def settings() -> AgentSettings:
-    """Return default AgentSettings for testing."""
-    return AgentSettings()
+    """Return default AgentSettings for testing (shared — model_copy before mutating)."""
+    return AgentSettings.default_unvalidated()
+
+
+@pytest.fixture(scope="session")
+def loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """One event loop for the session, instead of an asyncio.run() loop per call.
+
+    Not named event_loop — that name is reserved by pytest-asyncio.
+    """
+    event_loop = asyncio.new_event_loop()
+    yield event_loop
+    event_loop.close()
+
+
+@pytest.fixture(scope="session")
+def test_model() -> TestModel:
+    """Return a TestModel that answers without calling tools (shared, stateless)."""
+    from pydantic_ai.models.test import TestModel
+
+    return TestModel(call_tools=[])
+
+
+class StubQueueClient:
+    """Plain stand-in for MatchQueueClient that records what it was sent.
+
+    Set side_effect to a list to script successive submit_match outcomes —
+    task ids are returned, exceptions raised — as with a MagicMock.
+    """
+
+    def __init__(self) -> None:
+        self.submitted: list[dict[str, Any]] = []
+        self.side_effect: list[str | Exception] = []
+
+    def submit_match(self, payload: dict[str, Any]) -> str:
+        self.submitted.append(payload)
+        if not self.side_effect:
+            return "task-id-123"
+        outcome = self.side_effect.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def check_connection(self) -> bool:
+        return True
 
 
 @pytest.fixture
-def mock_queue_client() -> MagicMock:
-    """Return a mocked MatchQueueClient."""
-    client = MagicMock()
-    client.submit_match.return_value = "task-id-123"
-    client.check_connection.return_value = True
-    return client
+def queue_client() -> StubQueueClient:
+    """Return a fresh StubQueueClient."""
+    return StubQueueClient()
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING
 
+import pytest
+from pydantic_ai import Agent
 from pydantic_ai.models.test import TestModel
 
 from agent.core import create_agent
@@ -11,73 +13,99 @@ from agent.deps import AgentDeps
 from agent.result import AgentResult
 from config.settings import AgentSettings
 
+if TYPE_CHECKING:
+    from conftest import StubQueueClient
 
-def _make_deps() -> AgentDeps:
-    """Create AgentDeps with a mocked queue client (not called during TestModel runs)."""
-    queue_client = MagicMock()
-    settings = AgentSettings()
+
+@pytest.fixture
+def deps(settings: AgentSettings, queue_client: StubQueueClient) -> AgentDeps:
+    """AgentDeps around a stub queue client (not called during TestModel runs)."""
     return AgentDeps(queue_client=queue_client, settings=settings, dry_run=True)
 
 
-def _make_agent():
-    """Create an agent from default settings."""
-    settings = AgentSettings()
+@pytest.fixture(scope="session")
+def agent(settings: AgentSettings) -> Agent[AgentDeps, AgentResult]:
+    """Build the agent (and its tool schemas) once for the whole session."""
     return create_agent(settings)
 
 
 class TestMatchAgent:
-    def test_returns_agent_result(self) -> None:
-        agent = _make_agent()
+    def test_returns_agent_result(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         assert isinstance(result.output, AgentResult)
         assert isinstance(result.output.actions, list)
 
-    def test_reports_usage(self) -> None:
-        agent = _make_agent()
+    def test_reports_usage(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         usage = result.usage()
         assert usage.requests >= 1
 
-    def test_summary_is_string(self) -> None:
-        agent = _make_agent()
+    def test_summary_is_string(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         assert isinstance(result.output.summary, str)
 
-    def test_actions_default_empty(self) -> None:
-        agent = _make_agent()
+    def test_actions_default_empty(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         assert result.output.actions == []
 
-    def test_matches_found_default_zero(self) -> None:
-        agent = _make_agent()
+    def test_matches_found_default_zero(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         assert result.output.matches_found == 0
 
-    def test_matches_submitted_default_zero(self) -> None:
-        agent = _make_agent()
+    def test_matches_submitted_default_zero(
+        self,
+        agent: Agent[AgentDeps, AgentResult],
+        test_model: TestModel,
+        deps: AgentDeps,
+    ) -> None:
         result = agent.run_sync(
             "Review today's matches.",
-            deps=_make_deps(),
-            model=TestModel(call_tools=[]),
+            deps=deps,
+            model=test_model,
         )
         assert result.output.matches_submitted == 0
@@ -0,0 +1,307 @@
+"""Unit tests for the Typer CLI wiring."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+import structlog
+import typer
+from anthropic import (
+    APIStatusError,
+    APITimeoutError,
+    AuthenticationError,
+    RateLimitError,
+)
+from typer.main import get_command
+from typer.testing import CliRunner, Result
+
+from cli import main as cli_main
+from cli.main import _classify_error, app
+from config.settings import AgentSettings
+
+if TYPE_CHECKING:
+    from conftest import StubQueueClient
+
+
+class TestCliCommands:
+    def test_registers_exactly_run_check_scrape(self) -> None:
+        command = get_command(app)
+        assert sorted(command.commands) == ["check", "run", "scrape"]
+
+    def test_help_lists_commands(self) -> None:
+        result = CliRunner().invoke(app, ["--help"])
+        assert result.exit_code == 0
+        for name in ("run", "check", "scrape"):
+            assert name in result.output
+
+
+_PROXY = "http://proxy.test:8100"
+_REQUEST = httpx.Request("POST", f"{_PROXY}/v1/messages")
+
+
+def _status_error(cls: type[APIStatusError], status: int, message: str) -> APIStatusError:
+    response = httpx.Response(status, request=_REQUEST)
+    return cls(message, response=response, body=None)
+
+
+class TestClassifyError:
+    def test_httpx_connect_error_is_unreachable(self) -> None:
+        message, known = _classify_error(httpx.ConnectError("refused"), _PROXY)
+        assert known
+        assert f"Cannot reach proxy at {_PROXY}" in message
+
+    def test_api_connection_error_subclass_is_unreachable(self) -> None:
+        message, known = _classify_error(APITimeoutError(request=_REQUEST), _PROXY)
+        assert known
+        assert "Cannot reach proxy" in message
+
+    def test_authentication_error_beats_api_status_error(self) -> None:
+        message, known = _classify_error(
+            _status_error(AuthenticationError, 401, "bad key"), _PROXY
+        )
+        assert known
+        assert message.startswith("Authentication failed")
+
+    def test_authentication_error_subclass_keeps_precedence(self) -> None:
+        class ProxyAuthError(AuthenticationError):
+            pass
+
+        message, _ = _classify_error(_status_error(ProxyAuthError, 401, "bad key"), _PROXY)
+        assert message.startswith("Authentication failed")
+
+    def test_rate_limit_error_reports_status(self) -> None:
+        message, known = _classify_error(_status_error(RateLimitError, 429, "slow down"), _PROXY)
+        assert known
+        assert message == "API error 429: slow down"
+
+    def test_error_wrapped_in_cause_is_found(self) -> None:
+        try:
+            try:
+                raise httpx.ConnectError("refused")
+            except httpx.ConnectError as inner:
+                raise RuntimeError("agent run failed") from inner
+        except RuntimeError as outer:
+            message, known = _classify_error(outer, _PROXY)
+
+        assert known
+        assert "Cannot reach proxy" in message
+
+    def test_unknown_error_is_not_known(self) -> None:
+        message, known = _classify_error(ValueError("boom"), _PROXY)
+        assert not known
+        assert message == "boom"
+
+
+def _mock_probe(
+    monkeypatch: pytest.MonkeyPatch, handler: Callable[[httpx.Request], httpx.Response]
+) -> None:
+    """Route the shared proxy probe client through an in-process handler."""
+    monkeypatch.setattr(
+        cli_main, "_PROBE_CLIENT", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+
+def _proxy_settings() -> AgentSettings:
+    """Defaults pointed at the test proxy (fresh, as status_url is cached per instance)."""
+    return AgentSettings.model_construct(proxy_base_url=f"{_PROXY}/v1")
+
+
+class TestProxyPreflight:
+    def test_bare_mode_header_skips_body(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Body is not JSON — decoding it would raise
+        _mock_probe(
+            monkeypatch,
+            lambda _: httpx.Response(200, headers={"x-ironclaw-bare": "1"}, content=b"<html>"),
+        )
+        assert cli_main._proxy_preflight(_proxy_settings()) == _proxy_settings().model_name
+
+    def test_no_radius_session_json_is_bare_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _mock_probe(monkeypatch, lambda _: httpx.Response(200, json={"no_radius_session": True}))
+        assert cli_main._proxy_preflight(_proxy_settings()) == _proxy_settings().model_name
+
+    def test_radius_session_returns_allowed_model(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(str(request.url))
+            return httpx.Response(
+                200, json={"model_allowed": "radius-model", "tokens_remaining": 50_000}
+            )
+
+        _mock_probe(monkeypatch, handler)
+        assert cli_main._proxy_preflight(_proxy_settings()) == "radius-model"
+        assert seen == [f"{_PROXY}/status"]
+
+    def test_exhausted_budget_exits(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _mock_probe(monkeypatch, lambda _: httpx.Response(200, json={"tokens_remaining": 0}))
+        with pytest.raises(typer.Exit):
+            cli_main._proxy_preflight(_proxy_settings())
+
+
+class TestCheckCommand:
+    def test_shows_first_200_bytes_of_status_body(
+        self, monkeypatch: pytest.MonkeyPatch, queue_client: StubQueueClient
+    ) -> None:
+        _mock_probe(monkeypatch, lambda _: httpx.Response(200, content=b"a" * 200 + b"b" * 800))
+        monkeypatch.setattr(cli_main, "_get_queue_client", lambda _: queue_client)
+        # Keep check from pointing the global structlog config at CliRunner's streams
+        monkeypatch.setattr("utils.logger.configure_logging", lambda **_: None)
+
+        result = CliRunner().invoke(app, ["check", "--env", "no-such-env"])
+
+        assert result.exit_code == 0
+        assert "  status: 200" in result.output
+        assert f"  response: {'a' * 200}\n" in result.output
+        assert "  status: connected" in result.output
+
+    def test_non_200_status_prints_no_body(
+        self, monkeypatch: pytest.MonkeyPatch, queue_client: StubQueueClient
+    ) -> None:
+        _mock_probe(monkeypatch, lambda _: httpx.Response(503, content=b"down"))
+        monkeypatch.setattr(cli_main, "_get_queue_client", lambda _: queue_client)
+        monkeypatch.setattr("utils.logger.configure_logging", lambda **_: None)
+
+        result = CliRunner().invoke(app, ["check", "--env", "no-such-env"])
+
+        assert "  status: 503" in result.output
+        assert "response:" not in result.output
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("refused", request=request)
+
+
+class TestRunCommand:
+    @pytest.fixture(autouse=True)
+    def _proxy_enabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """These tests go through preflight, whatever the developer's shell exports."""
+        monkeypatch.delenv("AGENT_PROXY_ENABLED", raising=False)
+
+    def test_preflight_failure_logs_reach_the_caller(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _mock_probe(monkeypatch, _refuse)
+
+        result = CliRunner().invoke(
+            app, ["run", "--env", "no-such-env", "--proxy-url", f"{_PROXY}/v1"]
+        )
+
+        assert result.exit_code == 1
+        assert "preflight.proxy_unreachable" in result.output
+
+    def test_preflight_exit_unbinds_run_context(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        _mock_probe(monkeypatch, _refuse)
+
+        result = CliRunner().invoke(
+            app, ["run", "--env", "no-such-env", "--proxy-url", f"{_PROXY}/v1"]
+        )
+
+        assert result.exit_code == 1
+        assert structlog.contextvars.get_contextvars() == {}
+
+    def test_unknown_target_exits_before_preflight(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        probed: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            probed.append(request)
+            return httpx.Response(200, json={"no_radius_session": True})
+
+        _mock_probe(monkeypatch, handler)
+
+        result = CliRunner().invoke(
+            app,
+            ["run", "--env", "no-such-env", "--proxy-url", f"{_PROXY}/v1", "--target", "u99"],
+        )
+
+        assert result.exit_code == 1
+        assert "Unknown target 'u99'" in result.output
+        assert probed == []
+
+
+def _scraped(match_id: str, home: str, away: str) -> SimpleNamespace:
+    """Stand-in for src.scraper.models.Match (the fields the row builder reads)."""
+    return SimpleNamespace(
+        match_id=match_id,
+        home_team=home,
+        away_team=away,
+        home_score=None,
+        away_score=None,
+        match_datetime=datetime(2026, 2, 20, 18, 0, tzinfo=UTC),
+        location="Stadium",
+        match_status="scheduled",
+    )
+
+
+_IFA = "Intercontinental Football Academy of New England"
+
+
+@pytest.fixture
+def scraped_matches(
+    monkeypatch: pytest.MonkeyPatch, queue_client: StubQueueClient
+) -> list[SimpleNamespace]:
+    """Point scrape at a fake MLSScraper and the stub queue; the test fills the list."""
+    matches: list[SimpleNamespace] = []
+    scraper = SimpleNamespace(scrape_matches=AsyncMock(return_value=matches))
+    monkeypatch.setattr("src.scraper.mls_scraper.MLSScraper", lambda *_, **__: scraper)
+    monkeypatch.setattr(cli_main, "_get_queue_client", lambda _: queue_client)
+    monkeypatch.setattr("utils.logger.configure_logging", lambda **_: None)
+    return matches
+
+
+def _invoke_scrape(*args: str) -> Result:
+    """Run scrape over a fixed date window (no dotenv file)."""
+    return CliRunner().invoke(
+        app,
+        ["scrape", "--env", "no-such-env", "--from", "2026-02-18", "--to", "2026-02-25", *args],
+    )
+
+
+class TestScrapeCommand:
+    def test_json_output_lists_built_rows(self, scraped_matches: list[SimpleNamespace]) -> None:
+        scraped_matches += [_scraped("m-1", "Team A", "Team B"), _scraped("m-2", "C", "D")]
+
+        result = _invoke_scrape("--target", "u14-hg", "--json")
+
+        assert result.exit_code == 0
+        # First line is the "Scraping ..." banner; the rest is the JSON document
+        rows = json.loads(result.output.split("\n", 1)[1])
+        assert [row["external_match_id"] for row in rows] == ["m-1", "m-2"]
+        assert rows[0]["match_time"] == "18:00"
+
+    def test_team_filter_drops_other_matches(self, scraped_matches: list[SimpleNamespace]) -> None:
+        scraped_matches += [_scraped("m-1", _IFA, "Team B"), _scraped("m-2", "C", "D")]
+
+        result = _invoke_scrape("--target", "u14-hg-ifa")
+
+        assert result.exit_code == 0
+        assert "Found 2 matches (1 after filtering)" in result.output
+        assert "IFA vs Team B" in result.output
+        assert "C vs D" not in result.output
+
+    def test_submit_reports_counts(
+        self, scraped_matches: list[SimpleNamespace], queue_client: StubQueueClient
+    ) -> None:
+        scraped_matches += [_scraped("m-1", "A", "B"), _scraped("m-2", "C", "D")]
+        queue_client.side_effect = ["task-1", RuntimeError("broker down")]
+
+        result = _invoke_scrape("--target", "u14-hg", "--submit")
+
+        assert result.exit_code == 0
+        assert "Submitted 1 matches to queue (1 errors)." in result.output
+        assert [p["external_match_id"] for p in queue_client.submitted] == ["m-1", "m-2"]
+
+    def test_no_matches_exits_cleanly(
+        self, scraped_matches: list[SimpleNamespace], queue_client: StubQueueClient
+    ) -> None:
+        result = _invoke_scrape("--target", "u14-hg", "--submit")
+
+        assert result.exit_code == 0
+        assert "No matches found." in result.output
+        assert queue_client.submitted == []
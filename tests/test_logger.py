@@ -0,0 +1,95 @@
+"""Tests for the structlog configuration helpers."""
+
+from __future__ import annotations
+
+import io
+import threading
+
+from utils.logger import _STATIC_FIELDS, _add_static_fields, _QueuedWriter
+
+
+class _BrokenStream(io.RawIOBase):
+    """Binary stream whose reader has gone away (like `run 2>&1 | head`)."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, _: object) -> int:
+        raise BrokenPipeError
+
+
+def _drains_within(writer: _QueuedWriter, timeout: float = 2.0) -> bool:
+    """Run writer.drain() in a helper thread; report whether it returned in time."""
+    done = threading.Event()
+
+    def target() -> None:
+        writer.drain()
+        done.set()
+
+    threading.Thread(target=target, daemon=True).start()
+    return done.wait(timeout)
+
+
+class TestQueuedWriter:
+    def test_writes_str_and_bytes_lines(self) -> None:
+        stream = io.BytesIO()
+        writer = _QueuedWriter(stream)
+        writer.write("console line\n")
+        writer.write(b'{"event": "json"}\n')
+
+        assert _drains_within(writer)
+        assert stream.getvalue() == b'console line\n{"event": "json"}\n'
+        writer.close()
+
+    def test_broken_stream_does_not_hang_drain(self) -> None:
+        writer = _QueuedWriter(_BrokenStream())
+        writer.write("first\n")
+        writer.write("second\n")
+
+        assert _drains_within(writer)
+        writer.write("after failure\n")
+        assert _drains_within(writer)
+        writer.close()
+
+    def test_retarget_sends_later_lines_to_the_new_stream(self) -> None:
+        first, second = io.BytesIO(), io.BytesIO()
+        writer = _QueuedWriter(first)
+        writer.write("before\n")
+        writer.retarget(second)
+        writer.write("after\n")
+
+        assert _drains_within(writer)
+        assert first.getvalue() == b"before\n"
+        assert second.getvalue() == b"after\n"
+        writer.close()
+
+    def test_retarget_recovers_from_a_broken_stream(self) -> None:
+        stream = io.BytesIO()
+        writer = _QueuedWriter(_BrokenStream())
+        writer.write("lost\n")
+        writer.retarget(stream)
+        writer.write("kept\n")
+
+        assert _drains_within(writer)
+        assert stream.getvalue() == b"kept\n"
+        writer.close()
+
+    def test_writes_after_close_are_dropped(self) -> None:
+        stream = io.BytesIO()
+        writer = _QueuedWriter(stream)
+        writer.close()
+        writer.write("late\n")
+
+        assert _drains_within(writer)
+        assert stream.getvalue() == b""
+
+
+class TestAddStaticFields:
+    def test_stamps_host_and_pid(self) -> None:
+        event_dict = _add_static_fields(None, "info", {"event": "hello"})
+        assert event_dict == {"event": "hello", **_STATIC_FIELDS}
+
+    def test_caller_values_are_preserved(self) -> None:
+        event_dict = _add_static_fields(None, "info", {"host": "worker-7", "pid": 42})
+        assert event_dict["host"] == "worker-7"
+        assert event_dict["pid"] == 42
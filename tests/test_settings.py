@@ -0,0 +1,45 @@
+"""Tests for settings loading and its per-process cache."""
+
+from __future__ import annotations
+
+import pytest
+
+from config.settings import AgentSettings, load_settings
+
+# No envs/.env.<name> file — settings come from env vars and defaults only
+_NO_DOTENV = "no-such-env"
+
+
+@pytest.fixture(autouse=True)
+def _clean_agent_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Drop the AGENT_* vars these tests assert on, whatever the developer's shell exports."""
+    for name in ("AGENT_MODEL_NAME", "AGENT_DRY_RUN"):
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestLoadSettings:
+    def test_overrides_do_not_leak_between_calls(self) -> None:
+        first = load_settings(_NO_DOTENV)
+        first.model_name = "override-model"
+        first.dry_run = True
+
+        second = load_settings(_NO_DOTENV)
+        assert second.model_name != "override-model"
+        assert second.dry_run is False
+
+    def test_env_var_change_is_picked_up(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENT_MODEL_NAME", "model-a")
+        assert load_settings(_NO_DOTENV).model_name == "model-a"
+
+        monkeypatch.setenv("AGENT_MODEL_NAME", "model-b")
+        assert load_settings(_NO_DOTENV).model_name == "model-b"
+
+    def test_env_var_removal_is_picked_up(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENT_MODEL_NAME", "model-c")
+        assert load_settings(_NO_DOTENV).model_name == "model-c"
+
+        monkeypatch.delenv("AGENT_MODEL_NAME")
+        assert (
+            load_settings(_NO_DOTENV).model_name
+            == AgentSettings.model_fields["model_name"].default
+        )
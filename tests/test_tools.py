@@ -3,32 +3,58 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock
 
-from pydantic_ai import RunContext
+import pytest
 
 from agent.deps import AgentDeps
-from agent.tools import get_today_info, scrape_matches, submit_matches
+from agent.result import MatchRow
 from config.settings import AgentSettings
 
+if TYPE_CHECKING:
+    from conftest import StubQueueClient
+    from pydantic_ai import RunContext
 
-def _make_deps(
-    *,
-    dry_run: bool = False,
-    mock_queue: MagicMock | None = None,
-) -> AgentDeps:
-    """Create AgentDeps with a mocked queue client."""
-    queue = mock_queue or MagicMock()
-    queue.submit_match.return_value = "task-id-123"
-    settings = AgentSettings()
-    return AgentDeps(queue_client=queue, settings=settings, dry_run=dry_run)
 
+# Shared defaults; _make_deps swaps in the per-test queue client and flags
+_DEPS_TEMPLATE = AgentDeps(
+    queue_client=None,  # type: ignore[arg-type]
+    settings=AgentSettings.default_unvalidated(),
+)
+
+
+def _make_deps(queue_client: StubQueueClient, *, dry_run: bool = False) -> AgentDeps:
+    """Create AgentDeps around a (stub) queue client."""
+    # replace() would carry over the template's list — each test needs its own
+    return dataclasses.replace(
+        _DEPS_TEMPLATE, queue_client=queue_client, dry_run=dry_run, _scraped_matches=[]
+    )
+
+
+@pytest.fixture
+def mock_mls_scraper(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap agent.tools' scraper for a mock; set scrape_matches.return_value per test."""
+    scraper = MagicMock()
+    scraper.scrape_matches = AsyncMock(return_value=[])
+    monkeypatch.setattr("agent.tools.MLSScraper", lambda *_, **__: scraper)
+    # SimpleNamespace keeps the config JSON-serializable for the scrape cache key
+    monkeypatch.setattr("agent.tools.ScrapingConfig", SimpleNamespace)
+    return scraper
+
+
+@functools.cache
+def _ctx_template() -> RunContext[AgentDeps]:
+    """Minimal RunContext for testing tools outside PydanticAI; deps swapped in per test."""
+    from pydantic_ai import RunContext
 
-def _make_ctx(deps: AgentDeps) -> RunContext[AgentDeps]:
-    """Create a minimal RunContext for testing tools outside PydanticAI."""
     return RunContext(
-        deps=deps,
+        deps=None,  # type: ignore[arg-type]
         model=None,  # type: ignore[arg-type]
         usage={},  # type: ignore[arg-type]
         prompt="test",
@@ -37,6 +63,29 @@ def _make_ctx(deps: AgentDeps) -> RunContext[AgentDeps]:
     )
 
 
+def _make_ctx(deps: AgentDeps) -> RunContext[AgentDeps]:
+    """Return a RunContext for testing tools outside PydanticAI."""
+    return dataclasses.replace(_ctx_template(), deps=deps)
+
+
+@dataclass(slots=True)
+class FakeMatch:
+    """Plain stand-in for src.scraper.models.Match (the fields the tools read)."""
+
+    match_id: str = "m-1"
+    home_team: str = "Team A"
+    away_team: str = "Team B"
+    home_score: int | None = None
+    away_score: int | None = None
+    match_datetime: datetime = datetime(2026, 2, 20, 18, 0, tzinfo=UTC)
+    location: str | None = "Stadium"
+    competition: str = "League"
+    match_status: str = "scheduled"
+
+    def has_score(self) -> bool:
+        return self.home_score is not None and self.away_score is not None
+
+
 def _fake_match(
     *,
     match_id: str = "m-1",
@@ -44,166 +93,345 @@ def _fake_match(
     away: str = "Team B",
     home_score: int | None = None,
     away_score: int | None = None,
-) -> MagicMock:
-    """Create a mock Match object mimicking src.scraper.models.Match."""
-    m = MagicMock()
-    m.match_id = match_id
-    m.home_team = home
-    m.away_team = away
-    m.home_score = home_score
-    m.away_score = away_score
-    m.match_datetime = datetime(2026, 2, 20, 18, 0, tzinfo=UTC)
-    m.location = "Stadium"
-    m.competition = "League"
-    m.match_status = "scheduled" if home_score is None else "completed"
-    m.has_score.return_value = home_score is not None and away_score is not None
-    return m
+) -> FakeMatch:
+    """Create a stand-in for src.scraper.models.Match."""
+    return FakeMatch(
+        match_id=match_id,
+        home_team=home,
+        away_team=away,
+        home_score=home_score,
+        away_score=away_score,
+        match_status="scheduled" if home_score is None else "completed",
+    )
+
+
+def _make_row(*, home: str = "A", away: str = "B") -> MatchRow:
+    """Create a MatchRow as scrape_matches would accumulate it."""
+    return MatchRow(
+        home_team=home,
+        away_team=away,
+        match_date="2026-02-20",
+        match_time="18:00",
+        season="2025-26",
+        age_group="U14",
+        division="Northeast",
+        league="Homegrown",
+        home_score=None,
+        away_score=None,
+        match_status="scheduled",
+        external_match_id="m-1",
+        location="Stadium",
+    )
 
 
 class TestGetTodayInfo:
-    def test_returns_date_info(self) -> None:
-        deps = _make_deps()
+    def test_returns_date_info(self, queue_client: StubQueueClient) -> None:
+        from agent.tools import get_today_info
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
         result = get_today_info(ctx)
         assert "Date:" in result
         assert "Day:" in result
         assert "Week:" in result
 
-    def test_returns_time_utc(self) -> None:
-        deps = _make_deps()
+    def test_returns_time_utc(self, queue_client: StubQueueClient) -> None:
+        from agent.tools import get_today_info
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
         result = get_today_info(ctx)
         assert "Time (UTC):" in result
 
 
+class TestNormalizeTeamName:
+    def test_homegrown_uses_team_map(self) -> None:
+        from agent.tools import _normalize_team_name, _team_name_map
+
+        name = "Intercontinental Football Academy of New England"
+        mapping = _team_name_map("Homegrown")
+        assert _normalize_team_name(name, mapping=mapping) == "IFA"
+
+    def test_academy_overrides_team_map(self) -> None:
+        from agent.tools import _normalize_team_name, _team_name_map
+
+        name = "Intercontinental Football Academy of New England"
+        mapping = _team_name_map("Academy")
+        assert _normalize_team_name(name, mapping=mapping) == "IFA Academy"
+
+    def test_unknown_name_passes_through(self) -> None:
+        from agent.tools import _normalize_team_name, _team_name_map
+
+        mapping = _team_name_map("Academy")
+        assert _normalize_team_name("Team A", mapping=mapping) == "Team A"
+
+
 class TestScrapeMatches:
-    def test_returns_match_summary(self) -> None:
-        deps = _make_deps()
+    def test_returns_match_summary(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
 
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_matches = AsyncMock(
-            return_value=[
-                _fake_match(),
-                _fake_match(match_id="m-2", home="Team C", away="Team D"),
-            ]
-        )
+        mock_mls_scraper.scrape_matches.return_value = [
+            _fake_match(),
+            _fake_match(match_id="m-2", home="Team C", away="Team D"),
+        ]
 
-        with (
-            patch("src.scraper.mls_scraper.MLSScraper", return_value=mock_scraper),
-            patch("src.scraper.config.ScrapingConfig"),
-        ):
-            result = asyncio.run(
-                scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
-            )
+        result = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
 
         assert "Found 2 matches" in result
         assert "Team A vs Team B" in result
         assert "Team C vs Team D" in result
 
-    def test_no_matches_returns_message(self) -> None:
-        deps = _make_deps()
+    def test_no_matches_returns_message(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
 
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_matches = AsyncMock(return_value=[])
+        mock_mls_scraper.scrape_matches.return_value = []
 
-        with (
-            patch("src.scraper.mls_scraper.MLSScraper", return_value=mock_scraper),
-            patch("src.scraper.config.ScrapingConfig"),
-        ):
-            result = asyncio.run(
-                scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
-            )
+        result = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
 
         assert "No matches found" in result
 
-    def test_stores_matches_in_deps(self) -> None:
-        deps = _make_deps()
+    def test_stores_matches_in_deps(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
 
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_matches = AsyncMock(return_value=[_fake_match()])
+        mock_mls_scraper.scrape_matches.return_value = [_fake_match()]
 
-        with (
-            patch("src.scraper.mls_scraper.MLSScraper", return_value=mock_scraper),
-            patch("src.scraper.config.ScrapingConfig"),
-        ):
-            asyncio.run(scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25"))
+        loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
 
         assert len(deps._scraped_matches) == 1
-        assert deps._scraped_matches[0]["home_team"] == "Team A"
-        assert deps._scraped_matches[0]["match_time"] == "18:00"
-        assert deps._scraped_matches[0]["source"] == "match-scraper-agent"
-
-    def test_scored_match_includes_scores(self) -> None:
-        deps = _make_deps()
+        assert deps._scraped_matches[0].home_team == "Team A"
+        assert deps._scraped_matches[0].match_time == "18:00"
+        assert deps._scraped_matches[0].source == "match-scraper-agent"
+
+    def test_team_filter_keeps_only_matching_rows(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
+        deps.team_filter = "Team C"
         ctx = _make_ctx(deps)
 
-        mock_scraper = MagicMock()
-        mock_scraper.scrape_matches = AsyncMock(
-            return_value=[_fake_match(home_score=2, away_score=1)]
+        mock_mls_scraper.scrape_matches.return_value = [
+            _fake_match(),
+            _fake_match(match_id="m-2", home="Team C", away="Team D"),
+        ]
+
+        loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
         )
 
-        with (
-            patch("src.scraper.mls_scraper.MLSScraper", return_value=mock_scraper),
-            patch("src.scraper.config.ScrapingConfig"),
-        ):
-            result = asyncio.run(
-                scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
-            )
+        assert [m.external_match_id for m in deps._scraped_matches] == ["m-2"]
+
+    def test_scored_match_includes_scores(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
+        ctx = _make_ctx(deps)
+
+        mock_mls_scraper.scrape_matches.return_value = [_fake_match(home_score=2, away_score=1)]
+
+        result = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
 
         assert "(2-1)" in result
 
+    def test_cache_hit_skips_scraper(
+        self,
+        queue_client: StubQueueClient,
+        tmp_path,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
+        deps.settings = deps.settings.model_copy(
+            update={"scrape_cache_enabled": True, "scrape_cache_dir": str(tmp_path)}
+        )
+        ctx = _make_ctx(deps)
 
-class TestSubmitMatches:
-    def test_submits_scraped_matches(self) -> None:
-        mock_queue = MagicMock()
-        mock_queue.submit_match.return_value = "task-123"
-        deps = _make_deps(mock_queue=mock_queue)
-        deps._scraped_matches = [
-            {"home_team": "A", "away_team": "B", "match_date": "2026-02-20"},
-        ]
+        mock_mls_scraper.scrape_matches.return_value = [_fake_match()]
+
+        first = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
+        second = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
+
+        assert second == first
+        mock_mls_scraper.scrape_matches.assert_awaited_once()
+        assert deps._scraped_matches[1] == deps._scraped_matches[0]
+
+    def test_cache_write_failure_is_not_fatal(
+        self,
+        queue_client: StubQueueClient,
+        tmp_path,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        # A cache dir under a regular file can't be created (NotADirectoryError)
+        blocker = tmp_path / "blocker"
+        blocker.write_text("")
+        deps = _make_deps(queue_client)
+        deps.settings = deps.settings.model_copy(
+            update={"scrape_cache_enabled": True, "scrape_cache_dir": str(blocker / "cache")}
+        )
         ctx = _make_ctx(deps)
 
-        result = asyncio.run(submit_matches(ctx))
-        assert "Submitted 1 matches" in result
-        mock_queue.submit_match.assert_called_once()
+        mock_mls_scraper.scrape_matches.return_value = [_fake_match()]
 
-    def test_dry_run_skips_submission(self) -> None:
-        mock_queue = MagicMock()
-        deps = _make_deps(dry_run=True, mock_queue=mock_queue)
-        deps._scraped_matches = [
-            {"home_team": "A", "away_team": "B", "match_date": "2026-02-20"},
+        result = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
+
+        assert "Found 1 matches" in result
+        assert len(deps._scraped_matches) == 1
+
+    def test_large_result_summary_is_truncated(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+        mock_mls_scraper: MagicMock,
+    ) -> None:
+        from agent.tools import scrape_matches
+
+        deps = _make_deps(queue_client)
+        ctx = _make_ctx(deps)
+
+        mock_mls_scraper.scrape_matches.return_value = [
+            _fake_match(match_id=f"m-{i}", home=f"Home {i}") for i in range(50)
         ]
+
+        result = loop.run_until_complete(
+            scrape_matches(ctx, start_date="2026-02-18", end_date="2026-02-25")
+        )
+
+        assert "Found 50 matches" in result
+        assert "(10 more omitted)" in result
+        assert "Home 29 vs" in result
+        assert "Home 30 vs" not in result
+        assert "Home 49 vs" in result
+        assert len(deps._scraped_matches) == 50
+
+
+class TestSubmitMatches:
+    def test_submits_scraped_matches(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        from agent.tools import submit_matches
+
+        deps = _make_deps(queue_client)
+        deps._scraped_matches = [_make_row()]
         ctx = _make_ctx(deps)
 
-        result = asyncio.run(submit_matches(ctx))
+        result = loop.run_until_complete(submit_matches(ctx))
+        assert "Submitted 1 matches" in result
+        [payload] = queue_client.submitted
+        assert payload["home_team"] == "A"
+        assert payload["match_type"] == "League"
+
+    def test_dry_run_skips_submission(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        from agent.tools import submit_matches
+
+        deps = _make_deps(queue_client, dry_run=True)
+        deps._scraped_matches = [_make_row()]
+        ctx = _make_ctx(deps)
+
+        result = loop.run_until_complete(submit_matches(ctx))
         assert "[DRY RUN]" in result
-        mock_queue.submit_match.assert_not_called()
+        assert queue_client.submitted == []
 
-    def test_no_matches_returns_message(self) -> None:
-        deps = _make_deps()
+    def test_no_matches_returns_message(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        from agent.tools import submit_matches
+
+        deps = _make_deps(queue_client)
         ctx = _make_ctx(deps)
 
-        result = asyncio.run(submit_matches(ctx))
+        result = loop.run_until_complete(submit_matches(ctx))
         assert "No matches to submit" in result
 
-    def test_handles_submission_errors(self) -> None:
-        mock_queue = MagicMock()
-        mock_queue.submit_match.side_effect = [
-            "task-1",
-            Exception("connection lost"),
-            "task-3",
-        ]
-        deps = _make_deps(mock_queue=mock_queue)
+    def test_handles_submission_errors(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        from agent.tools import submit_matches
+
+        queue_client.side_effect = ["task-1", Exception("connection lost"), "task-3"]
+        deps = _make_deps(queue_client)
         deps._scraped_matches = [
-            {"home_team": "A", "away_team": "B"},
-            {"home_team": "C", "away_team": "D"},
-            {"home_team": "E", "away_team": "F"},
+            _make_row(home="A", away="B"),
+            _make_row(home="C", away="D"),
+            _make_row(home="E", away="F"),
         ]
         ctx = _make_ctx(deps)
 
-        result = asyncio.run(submit_matches(ctx))
+        result = loop.run_until_complete(submit_matches(ctx))
         assert "Submitted 2 matches" in result
         assert "1 errors" in result
+
+    def test_publishes_in_scrape_order(
+        self,
+        queue_client: StubQueueClient,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        from agent.tools import submit_matches
+
+        deps = _make_deps(queue_client)
+        deps._scraped_matches = [_make_row(home=h, away="X") for h in ("A", "B", "C", "D")]
+        ctx = _make_ctx(deps)
+
+        loop.run_until_complete(submit_matches(ctx))
+        assert [p["home_team"] for p in queue_client.submitted] == ["A", "B", "C", "D"]